@@ -0,0 +1,236 @@
+# answer_cards.py
+import os
+import re
+import json
+import time
+import threading
+from functools import lru_cache
+
+from db import (
+    _strong_tokens,
+    corpus_version,
+    delete_answer_card,
+    ensure_answer_cards_table,
+    find_by_query,
+    latest_updated_at,
+    load_answer_cards,
+    upsert_answer_card,
+)
+from summarizer import answer_with_gemini
+
+ANSWER_CARDS_FILE = os.getenv("ANSWER_CARDS_FILE")
+ANSWER_CARD_YEARS = 3
+ANSWER_CARD_CACHE_TTL = float(os.getenv("ANSWER_CARD_CACHE_TTL", "60"))
+
+# 주제 → 검색 키워드(queries, 각각 find_by_query로 검색해 합침), LLM에 넘길 대표 질문,
+# 매칭 키워드(하나 이상 필수), 함께 나와도 되는 보조어(extra).
+# ANSWER_CARDS_FILE(JSON, 같은 형식)로 교체 가능
+DEFAULT_TOPICS = {
+    "수강신청": {
+        "queries": ["수강신청", "수강정정"],
+        "question": "수강신청 일정과 방법 알려줘",
+        "keywords": ["수강신청", "수강정정"],
+    },
+    "졸업": {
+        "queries": ["졸업"],
+        "question": "졸업 요건과 졸업 관련 일정 알려줘",
+        "keywords": ["졸업", "졸업요건"],
+        "extra": ["요건", "논문", "졸업논문", "사정", "졸업사정"],
+    },
+    "장학금": {
+        "queries": ["장학금", "장학생"],
+        "question": "장학금 신청 일정과 방법 알려줘",
+        "keywords": ["장학금", "장학생"],
+    },
+    "계절학기": {
+        "queries": ["계절학기"],
+        "question": "계절학기 수강신청 일정과 방법 알려줘",
+        "keywords": ["계절학기", "계절수업"],
+        "extra": ["수강신청", "등록금"],
+    },
+    "채용": {
+        "queries": ["채용", "인턴십"],
+        "question": "최근 채용 및 인턴십 공지 알려줘",
+        "keywords": ["채용", "인턴", "인턴십", "취업"],
+    },
+}
+
+# 주제 키워드 외에 있어도 같은 질문으로 보는 일반 질의 표현
+GENERIC_TOKENS = {
+    "언제", "언제야", "언제예요", "언제까지", "일정", "기간", "날짜", "마감", "마감일",
+    "방법", "어떻게", "신청", "신청방법", "절차", "요건", "조건", "기준", "대상",
+    "뭐야", "뭐예요", "정보", "알려", "줘", "좀", "해", "해줘", "해야", "하나요",
+    "돼", "되나요", "궁금해", "궁금합니다", "어디서", "어디", "관련해서", "공고",
+    "확인", "하는", "하려면", "위한", "소식", "및",
+}
+
+
+# 토큰 끝 조사(예: 장학금은 → 장학금). 키워드 비교 전에 한 번만 떼어냄
+PARTICLE_RE = re.compile(r"(은|는|이|가|을|를|과|와|도|의|에|에서|으로|로|이랑|랑)$")
+
+
+@lru_cache(maxsize=1)
+def load_topics() -> dict:
+    """사전 계산 대상 주제 설정(프로세스당 한 번 로드)."""
+    if ANSWER_CARDS_FILE:
+        with open(ANSWER_CARDS_FILE, encoding="utf-8") as f:
+            return json.load(f)
+    return DEFAULT_TOPICS
+
+
+def _normalize(tok: str) -> str:
+    """토큰 끝 조사 제거(제거 후 1글자 이하가 되면 원형 유지)."""
+    stripped = PARTICLE_RE.sub("", tok)
+    return stripped if len(stripped) >= 2 else tok
+
+
+def match_topic(question: str, topics: dict | None = None) -> str | None:
+    """질문을 사전 계산 주제에 대응(애매하면 None → 실시간 생성).
+
+    토큰 단위로만 비교한다(부분 문자열 X). 국가장학금·채용설명회처럼 더 구체적인
+    토큰은 키워드에 명시하지 않는 한 일반 카드로 대응하지 않는다.
+    주제 키워드가 하나 이상 있고 나머지 토큰이 모두 키워드·보조어·일반 표현인
+    주제가 정확히 하나일 때만 그 주제로 본다.
+    """
+    topics = topics or load_topics()
+    toks = {_normalize(tok) for tok in _strong_tokens(question)}
+    hits = []
+    for name, t in topics.items():
+        keywords = set(t["keywords"])
+        allowed = keywords | set(t.get("extra", [])) | GENERIC_TOKENS
+        if toks & keywords and toks <= allowed:
+            hits.append(name)
+    return hits[0] if len(hits) == 1 else None
+
+
+def build_citations(rows):
+    """검색 결과 → /chat 응답용 인용 목록."""
+    return [
+        {
+            "title": r["title"],
+            "url": r["url"],
+            "posted_at": r["posted_at"],
+            "summary": r.get("summary") or "",
+        }
+        for r in rows
+    ]
+
+
+def retrieve_for_topic(t: dict, limit: int = 5):
+    """주제 검색 키워드별 결과를 합쳐 상위 limit개(find_by_query와 같이 제목 매칭 → 최신순).
+
+    대표 질문 문장을 그대로 검색하면 조사/어미까지 AND 조건이 되므로 키워드만 쓴다.
+    """
+    merged = {}
+    for query in t["queries"]:
+        for r in find_by_query(query, limit=limit, since_years=ANSWER_CARD_YEARS):
+            if r["id"] not in merged or r["in_title_score"] > merged[r["id"]]["in_title_score"]:
+                merged[r["id"]] = r
+    rows = sorted(
+        merged.values(),
+        key=lambda r: (
+            r["in_title_score"],
+            r["posted_at"] is not None,
+            r["posted_at"] or 0,
+        ),
+        reverse=True,
+    )
+    return rows[:limit]
+
+
+async def precompute_answer_cards() -> dict:
+    """refresh 후: 주제별 대표 질문을 검색+LLM으로 미리 답해 저장.
+
+    실패(검색 결과 없음/LLM 오류)한 주제는 이전 카드를 지워 실시간 생성으로 돌린다.
+    """
+    ensure_answer_cards_table()
+    stored, errors = [], []
+    for topic, t in load_topics().items():
+        try:
+            # 검색 전에 기록해야 그 사이 들어온 공지가 카드를 stale로 만든다
+            source_updated_at = latest_updated_at(t["queries"], ANSWER_CARD_YEARS)
+            rows = retrieve_for_topic(t)
+            if not rows:
+                errors.append({"topic": topic, "error": "no_rows"})
+                delete_answer_card(topic)
+                continue
+            answer = await answer_with_gemini(t["question"], rows, fallback=False)
+            citations = [
+                {**c, "posted_at": c["posted_at"].isoformat() if c["posted_at"] else None}
+                for c in build_citations(rows)
+            ]
+            upsert_answer_card(
+                {
+                    "topic": topic,
+                    "question": t["question"],
+                    "answer": answer,
+                    "citations": citations,
+                    "notice_ids": [r["id"] for r in rows],
+                    "source_updated_at": source_updated_at,
+                }
+            )
+            stored.append(topic)
+        except Exception as e:
+            errors.append({"topic": topic, "error": repr(e)})
+            try:
+                delete_answer_card(topic)
+            except Exception:
+                pass
+    invalidate()
+    return {"stored": stored, "errors": errors}
+
+
+_cache_lock = threading.Lock()
+_cache = {"version": None, "loaded_at": 0.0, "cards": {}}
+
+
+def _fresh(card, topic_updated_at) -> bool:
+    """인용 공지가 모두 남아 있고, 생성 이후 인용 공지·주제 검색 대상 공지가
+    추가/갱신되지 않았으면 신선."""
+    if card["live_count"] < len(card["notice_ids"]):
+        return False
+    source = card["source_updated_at"]
+    if source is None:
+        return False
+    return all(
+        current is None or current <= source
+        for current in (card["current_updated_at"], topic_updated_at)
+    )
+
+
+def _fresh_cards():
+    """설정에 있는 주제의 신선한 카드만 {topic: card}."""
+    topics = load_topics()
+    cards = {}
+    for c in load_answer_cards():
+        t = topics.get(c["topic"])
+        if t and _fresh(c, latest_updated_at(t["queries"], ANSWER_CARD_YEARS)):
+            cards[c["topic"]] = c
+    return cards
+
+
+def invalidate():
+    with _cache_lock:
+        _cache["version"] = None
+
+
+def get_card(question: str):
+    """질문에 대응하는 신선한 답변 카드(없으면 None).
+
+    코퍼스 버전이 같고 ANSWER_CARD_CACHE_TTL 이내면 메모리 캐시를 쓴다.
+    """
+    topic = match_topic(question)
+    if topic is None:
+        return None
+    version = corpus_version()
+    now = time.monotonic()
+    with _cache_lock:
+        if (
+            _cache["version"] == version
+            and now - _cache["loaded_at"] < ANSWER_CARD_CACHE_TTL
+        ):
+            return _cache["cards"].get(topic)
+    cards = _fresh_cards()
+    with _cache_lock:
+        _cache.update(version=version, loaded_at=now, cards=cards)
+    return cards.get(topic)
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+제목 추천 인덱스 벤치마크
+- 합성 제목 N개(기본 100,000)로 인덱스 구성
+- 음절/조합 중/초성 질의 지연시간 p50/p99 측정 (목표: p99 < 2ms)
+"""
+
+import sys
+import time
+import random
+import datetime as dt
+
+from suggest import SuggestIndex
+
+WORDS = [
+    "수강신청", "졸업", "장학금", "계절학기", "채용", "인턴십", "경진대회", "해커톤",
+    "설명회", "특강", "세미나", "캡스톤디자인", "현장실습", "교환학생", "복수전공",
+    "전과", "휴학", "복학", "등록금", "기숙사", "sw중심대학", "ai", "교육과정",
+    "시간표", "성적", "연구실", "학부생", "대학원", "공모전", "봉사활동",
+]
+QUERIES = [
+    "수", "수ㄱ", "수강", "수강신", "장", "장하", "장학", "ㅈㅎㄱ", "ㄱ", "ㄱㅈ",
+    "계절", "채", "채용", "졸", "졸어", "인턴", "해커", "ai", "sw", "2025",
+    "캡스", "현장실", "교환", "ㅎㅋㅌ", "기숙", "등록그", "세미",
+]
+
+
+def synthetic_docs(n: int, seed: int = 42):
+    """합성 공지 제목 생성."""
+    rng = random.Random(seed)
+    start = dt.datetime(2015, 1, 1)
+    docs = []
+    for i in range(n):
+        year = rng.randint(2015, 2026)
+        words = rng.sample(WORDS, rng.randint(2, 4))
+        title = f"[공지] {year}학년도 " + " ".join(words) + f" 안내 ({i})"
+        posted = start + dt.timedelta(minutes=rng.randint(0, 60 * 24 * 365 * 11))
+        docs.append({"id": i, "title": title, "posted_at": posted})
+    return docs
+
+
+def main(n: int = 100_000, rounds: int = 200):
+    docs = synthetic_docs(n)
+
+    t0 = time.perf_counter()
+    index = SuggestIndex(docs)
+    build_sec = time.perf_counter() - t0
+    print(f"📦 인덱스 구성: {n:,}개 제목, 키 {len(index.keys):,}개, {build_sec:.2f}s")
+
+    # delta 경로도 함께 측정
+    for d in synthetic_docs(200, seed=7):
+        index.add(n + d["id"], d["title"], d["posted_at"])
+
+    samples = []
+    for _ in range(rounds):
+        for q in QUERIES:
+            t = time.perf_counter()
+            index.suggest(q, limit=8)
+            samples.append((time.perf_counter() - t) * 1000)
+    samples.sort()
+    p50 = samples[len(samples) // 2]
+    p99 = samples[int(len(samples) * 0.99) - 1]
+    print(f"⏱️  질의 {len(samples):,}회: p50 {p50:.3f}ms, p99 {p99:.3f}ms, max {samples[-1]:.3f}ms")
+
+    print()
+    for q in ["장하", "ㅈㅎㄱ", "수강신"]:
+        print(f"🔎 {q!r}: " + ", ".join(r["title"] for r in index.suggest(q, limit=3)))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
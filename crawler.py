@@ -160,6 +160,28 @@ async def collect_all_items(
     return list(items_map.values())
 
 
+def parse_posted_at(text: str):
+    """텍스트에서 첫 날짜(YYYY.MM.DD 등)를 게시일로 추출·검증."""
+    m = re.search(r"(20\d{2})[.\-/년 ]\s?(\d{1,2})[.\-/월 ]\s?(\d{1,2})", text)
+    posted_at = None
+    if m:
+        y, mo, d = map(int, m.groups())
+        try:
+            posted_at = dt.datetime(y, mo, d)
+
+            # 날짜 검증: 미래 날짜(1년 초과) 또는 너무 오래된 날짜(2010년 이전) 필터링
+            current_year = dt.datetime.now().year
+            if posted_at.year > current_year + 1:
+                # 미래 날짜는 현재 연도로 보정
+                posted_at = posted_at.replace(year=current_year)
+            elif posted_at.year < 2010:
+                # 너무 오래된 날짜는 None으로
+                posted_at = None
+        except:
+            posted_at = None
+    return posted_at
+
+
 def parse_detail(html: str, return_meta: bool = False):
     """상세 페이지에서 본문/게시일 추출 및 클린업."""
     soup = BeautifulSoup(html, "lxml")
@@ -204,24 +226,7 @@ def parse_detail(html: str, return_meta: bool = False):
     if len(text) < 80 and len(raw_text) > len(text):
         text = _normalize_spaces(raw_text)
 
-    page_text = soup.get_text(" ", strip=True)
-    m = re.search(r"(20\d{2})[.\-/년 ]\s?(\d{1,2})[.\-/월 ]\s?(\d{1,2})", page_text)
-    posted_at = None
-    if m:
-        y, mo, d = map(int, m.groups())
-        try:
-            posted_at = dt.datetime(y, mo, d)
-
-            # 날짜 검증: 미래 날짜(1년 초과) 또는 너무 오래된 날짜(2010년 이전) 필터링
-            current_year = dt.datetime.now().year
-            if posted_at.year > current_year + 1:
-                # 미래 날짜는 현재 연도로 보정
-                posted_at = posted_at.replace(year=current_year)
-            elif posted_at.year < 2010:
-                # 너무 오래된 날짜는 None으로
-                posted_at = None
-        except:
-            posted_at = None
+    posted_at = parse_posted_at(soup.get_text(" ", strip=True))
 
     return (
         (text, posted_at, {"selector": used_selector})
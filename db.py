@@ -1,13 +1,20 @@
 # db.py
 import os
 import re
+import time
+import threading
 import datetime as dt
 
 import psycopg2
 from dateutil.relativedelta import relativedelta
-from psycopg2.extras import RealDictCursor
+from psycopg2.extras import RealDictCursor, Json
 
 DATABASE_URL = os.getenv("DATABASE_URL")
+CORPUS_VERSION_TTL = float(os.getenv("CORPUS_VERSION_TTL", "30"))
+
+# 코퍼스 버전 캐시: (버전 문자열, 조회 시각). 워커마다 따로 유지됨
+_corpus_lock = threading.Lock()
+_corpus_cache = {"version": None, "fetched_at": 0.0, "local": 0}
 
 STOPWORDS = {
     "공지",
@@ -57,7 +64,7 @@ def get_conn():
 
 
 def upsert_notice(n: dict):
-    """공지 UPSERT(요약/본문/날짜 갱신)."""
+    """공지 UPSERT(요약/본문/날짜 갱신). 저장된 (id, posted_at) 반환."""
     conn = get_conn()
     cur = conn.cursor()
     cur.execute(
@@ -71,12 +78,57 @@ def upsert_notice(n: dict):
           updated_at = now(),
           summary = EXCLUDED.summary,
           checksum = EXCLUDED.checksum
+        RETURNING id, posted_at
         """,
         n,
     )
+    row = cur.fetchone()
     conn.commit()
     cur.close()
     conn.close()
+    bump_corpus_version()
+    return row
+
+
+def bump_corpus_version():
+    """로컬 코퍼스 버전 증가 + DB 기반 버전 캐시 무효화."""
+    with _corpus_lock:
+        _corpus_cache["local"] += 1
+        _corpus_cache["version"] = None
+
+
+def corpus_version() -> str:
+    """공지 코퍼스 버전(ETag 기준값).
+
+    DB의 (건수, 최종 updated_at)에서 만든 값을 TTL 동안 캐시한다.
+    다른 워커가 refresh 해도 TTL 안에 반영된다.
+    """
+    now = time.monotonic()
+    with _corpus_lock:
+        cached = _corpus_cache["version"]
+        if cached and now - _corpus_cache["fetched_at"] < CORPUS_VERSION_TTL:
+            return cached
+        local = _corpus_cache["local"]
+
+    conn = get_conn()
+    cur = conn.cursor()
+    cur.execute("SELECT COUNT(*), MAX(updated_at) FROM notices")
+    count, last_updated = cur.fetchone()
+    cur.close()
+    conn.close()
+
+    stamp = last_updated.timestamp() if last_updated else 0
+    version = f"{count}-{stamp:.6f}"
+    with _corpus_lock:
+        if _corpus_cache["local"] == local:
+            _corpus_cache["version"] = version
+            _corpus_cache["fetched_at"] = now
+    return version
+
+
+def search_cutoff(since_years: int = 3) -> dt.date:
+    """검색 기간 하한(일 단위). 하루 동안 고정돼야 검색 ETag에 넣을 수 있다."""
+    return dt.date.today() - relativedelta(years=since_years)
 
 
 def find_by_query(q: str, limit=10, since_years: int = 3, include_past: bool = True):
@@ -92,9 +144,8 @@ def find_by_query(q: str, limit=10, since_years: int = 3, include_past: bool = T
         params[f"c{i}"] = f"%{tok}%"
 
     # 날짜 필터링
-    cutoff = dt.datetime.now() - relativedelta(years=since_years)
     and_clauses.append("posted_at >= %(cutoff)s")
-    params["cutoff"] = cutoff
+    params["cutoff"] = search_cutoff(since_years)
 
     # 과거 공지 제외 옵션 (미래 또는 최근 공지만)
     if not include_past:
@@ -144,3 +195,128 @@ def get_notice_full(id_: int):
     cur.close()
     conn.close()
     return row
+
+
+def list_notice_titles():
+    """추천 인덱스용 (id, title, posted_at) 전체 조회."""
+    conn = get_conn()
+    cur = conn.cursor(cursor_factory=RealDictCursor)
+    cur.execute("SELECT id, title, posted_at FROM notices")
+    rows = cur.fetchall()
+    cur.close()
+    conn.close()
+    return rows
+
+
+ANSWER_CARDS_SQL = """
+CREATE TABLE IF NOT EXISTS answer_cards (
+    topic TEXT PRIMARY KEY,
+    question TEXT NOT NULL,
+    answer TEXT NOT NULL,
+    citations JSONB NOT NULL,
+    notice_ids INTEGER[] NOT NULL,
+    source_updated_at TIMESTAMP WITH TIME ZONE,
+    generated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+)
+"""
+
+
+def ensure_answer_cards_table():
+    """answer_cards 테이블 생성(없을 때만)."""
+    conn = get_conn()
+    cur = conn.cursor()
+    cur.execute(ANSWER_CARDS_SQL)
+    conn.commit()
+    cur.close()
+    conn.close()
+
+
+def upsert_answer_card(card: dict):
+    """사전 계산 답변 카드 UPSERT."""
+    conn = get_conn()
+    cur = conn.cursor()
+    cur.execute(
+        """
+        INSERT INTO answer_cards (topic, question, answer, citations, notice_ids, source_updated_at, generated_at)
+        VALUES (%(topic)s, %(question)s, %(answer)s, %(citations)s, %(notice_ids)s, %(source_updated_at)s, now())
+        ON CONFLICT (topic) DO UPDATE SET
+          question = EXCLUDED.question,
+          answer = EXCLUDED.answer,
+          citations = EXCLUDED.citations,
+          notice_ids = EXCLUDED.notice_ids,
+          source_updated_at = EXCLUDED.source_updated_at,
+          generated_at = now()
+        """,
+        {**card, "citations": Json(card["citations"])},
+    )
+    conn.commit()
+    cur.close()
+    conn.close()
+
+
+def delete_answer_card(topic: str):
+    """답변 카드 삭제(재계산 실패 시 이전 카드를 계속 내보내지 않도록)."""
+    conn = get_conn()
+    cur = conn.cursor()
+    cur.execute("DELETE FROM answer_cards WHERE topic = %s", (topic,))
+    conn.commit()
+    cur.close()
+    conn.close()
+
+
+def latest_updated_at(queries, since_years: int = 3):
+    """queries 중 하나라도 find_by_query 조건에 맞는 공지의 MAX(updated_at)."""
+    params = {"cutoff": search_cutoff(since_years)}
+    any_clauses = []
+    for j, q in enumerate(queries):
+        and_clauses = []
+        for i, tok in enumerate(_strong_tokens(q)):
+            and_clauses.append(f"(title ILIKE %(q{j}_{i})s OR content ILIKE %(q{j}_{i})s)")
+            params[f"q{j}_{i}"] = f"%{tok}%"
+        if and_clauses:
+            any_clauses.append("(" + " AND ".join(and_clauses) + ")")
+    if not any_clauses:
+        return None
+
+    conn = get_conn()
+    cur = conn.cursor()
+    cur.execute(
+        f"""
+        SELECT MAX(updated_at)
+        FROM notices
+        WHERE posted_at >= %(cutoff)s AND ({" OR ".join(any_clauses)})
+    """,
+        params,
+    )
+    latest = cur.fetchone()[0]
+    cur.close()
+    conn.close()
+    return latest
+
+
+def load_answer_cards():
+    """답변 카드 + 인용 공지의 현재 최종 updated_at/존재 건수(신선도 판단용)."""
+    conn = get_conn()
+    cur = conn.cursor(cursor_factory=RealDictCursor)
+    cur.execute("SELECT to_regclass('answer_cards') IS NOT NULL AS exists")
+    if not cur.fetchone()["exists"]:
+        cur.close()
+        conn.close()
+        return []
+    cur.execute(
+        """
+        SELECT c.topic, c.question, c.answer, c.citations, c.notice_ids,
+               c.source_updated_at, c.generated_at,
+               s.current_updated_at, s.live_count
+        FROM answer_cards c
+        LEFT JOIN LATERAL (
+          SELECT MAX(n.updated_at) AS current_updated_at, COUNT(*) AS live_count
+          FROM notices n
+          WHERE n.id = ANY(c.notice_ids)
+        ) s ON TRUE
+    """
+    )
+    rows = cur.fetchall()
+    cur.close()
+    conn.close()
+    return rows
@@ -0,0 +1,65 @@
+# http_cache.py
+import os
+import hashlib
+
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from db import corpus_version
+
+CACHE_MAX_AGE = int(os.getenv("CACHE_MAX_AGE", "60"))
+CACHE_STALE_WHILE_REVALIDATE = int(os.getenv("CACHE_STALE_WHILE_REVALIDATE", "300"))
+
+
+def cache_control() -> str:
+    """Cache-Control 헤더 값."""
+    return (
+        f"public, max-age={CACHE_MAX_AGE}, "
+        f"stale-while-revalidate={CACHE_STALE_WHILE_REVALIDATE}"
+    )
+
+
+def make_etag(request: Request, version: str | None = None) -> str:
+    """버전(기본: 코퍼스 버전) + 경로/쿼리로 강한 ETag 생성."""
+    version = corpus_version() if version is None else version
+    key = f"{version}|{request.url.path}?{request.url.query}"
+    return '"' + hashlib.sha1(key.encode("utf-8")).hexdigest() + '"'
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    """If-None-Match 헤더와 약한 비교(W/ 접두어 무시, RFC 9110 §13.1.2).
+
+    '*'는 대상 존재 여부를 먼저 확인해야 하므로 지원하지 않는다.
+    """
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    candidates = [c.strip().removeprefix("W/") for c in header.split(",")]
+    return etag in candidates
+
+
+def not_modified(request: Request, version: str | None = None):
+    """ETag가 일치하면 304 응답, 아니면 (None, etag) 반환.
+
+    응답 본문이 코퍼스와 다른 시점의 데이터(예: 메모리 인덱스)에서 나오면
+    그 데이터의 version을 넘겨 본문과 ETag가 어긋나지 않게 한다.
+    """
+    etag = make_etag(request, version)
+    if _etag_matches(request, etag):
+        return (
+            Response(
+                status_code=304,
+                headers={"ETag": etag, "Cache-Control": cache_control()},
+            ),
+            etag,
+        )
+    return None, etag
+
+
+def cached_json(payload, etag: str) -> JSONResponse:
+    """ETag/Cache-Control 헤더를 붙인 JSON 응답."""
+    return JSONResponse(
+        content=jsonable_encoder(payload),
+        headers={"ETag": etag, "Cache-Control": cache_control()},
+    )
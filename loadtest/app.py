@@ -0,0 +1,39 @@
+# loadtest/app.py
+"""
+부하 테스트용 앱 래퍼: main.app + 이벤트 루프 지연 측정 엔드포인트.
+uvicorn loadtest.app:app 으로 실행 (운영 배포에는 사용하지 않음).
+"""
+
+import os
+import time
+import asyncio
+from collections import deque
+
+from main import app
+
+LAG_INTERVAL_SEC = 0.05
+# 폴링되지 않는 워커도 메모리가 늘지 않도록 최근 샘플만 유지(약 10분)
+LAG_MAX_SAMPLES = 12000
+_lag_ms = deque(maxlen=LAG_MAX_SAMPLES)
+
+
+async def _watch_loop_lag():
+    """주기적으로 sleep 후 (측정 시각 epoch초, 초과 지연 ms)를 기록."""
+    while True:
+        t = time.perf_counter()
+        await asyncio.sleep(LAG_INTERVAL_SEC)
+        lag = (time.perf_counter() - t - LAG_INTERVAL_SEC) * 1000
+        _lag_ms.append((time.time(), lag))
+
+
+@app.on_event("startup")
+async def _start_lag_watcher():
+    asyncio.get_running_loop().create_task(_watch_loop_lag())
+
+
+@app.get("/__loadtest/loop-lag")
+async def loop_lag():
+    """워커별 루프 지연 샘플([epoch초, ms] 목록) 반환 후 초기화."""
+    samples = list(_lag_ms)
+    _lag_ms.clear()
+    return {"pid": os.getpid(), "samples_ms": samples}
@@ -0,0 +1,301 @@
+#!/usr/bin/env python3
+"""
+/chat, /notices/search 오픈 루프 부하 테스트
+- LLM 스텁 서버와 앱(uvicorn, 워커 수 지정)을 로컬에서 띄운 뒤
+- 목표 RPS의 포아송 도착으로 요청을 보내고(응답을 기다리지 않음)
+- 처리량, p50/p95/p99 지연, 오류율, 이벤트 루프 지연을 JSON으로 출력
+
+DB는 LOADTEST_DATABASE_URL만 사용(.env 미사용)하며 앱 프로세스에 DATABASE_URL로 넘긴다.
+로컬이 아닌 호스트는 --allow-remote 없이는 거부한다.
+
+사용: LOADTEST_DATABASE_URL=postgresql://localhost/asknu_load python -m loadtest.run --rps 20 --workers 2
+"""
+
+import os
+import sys
+import json
+import math
+import time
+import random
+import asyncio
+import argparse
+import subprocess
+from collections import Counter, defaultdict
+
+import httpx
+
+from loadtest.seed import loadtest_database_url, seed
+
+CHAT_QUESTIONS = [
+    "수강신청 기간 언제야?",
+    "수강정정 언제까지 할 수 있어?",
+    "졸업요건 확인 방법 알려줘",
+    "졸업논문 제출 마감일이 언제야?",
+    "국가장학금 신청 방법 알려줘",
+    "성적우수 장학금 기준이 뭐야?",
+    "계절학기 수강신청 일정 알려줘",
+    "계절학기 등록금 납부 기간은?",
+    "채용설명회 일정 있어?",
+    "인턴십 모집 공지 알려줘",
+    "최근 경진대회 공지 알려줘",
+    "해커톤 참가 신청 어떻게 해?",
+]
+SEARCH_QUERIES = [
+    "수강신청", "수강정정", "졸업", "장학금", "국가장학금", "계절학기",
+    "채용", "인턴십", "경진대회", "해커톤", "특강", "세미나",
+]
+
+
+def percentile(values, p: float):
+    """최근접 순위 백분위수."""
+    if not values:
+        return None
+    values = sorted(values)
+    k = max(0, math.ceil(p / 100 * len(values)) - 1)
+    return round(values[k], 2)
+
+
+def summarize_ms(values):
+    return {
+        "count": len(values),
+        "p50": percentile(values, 50),
+        "p95": percentile(values, 95),
+        "p99": percentile(values, 99),
+        "max": round(max(values), 2) if values else None,
+    }
+
+
+def _spawn(module_app: str, port: int, env: dict, workers: int = 1):
+    return subprocess.Popen(
+        [
+            sys.executable, "-m", "uvicorn", module_app,
+            "--host", "127.0.0.1", "--port", str(port),
+            "--workers", str(workers), "--log-level", "warning",
+        ],
+        env={**os.environ, **env},
+    )
+
+
+async def _wait_ready(url: str, timeout: float = 30):
+    deadline = time.monotonic() + timeout
+    async with httpx.AsyncClient() as client:
+        while time.monotonic() < deadline:
+            try:
+                if (await client.get(url)).status_code < 500:
+                    return
+            except httpx.TransportError:
+                pass
+            await asyncio.sleep(0.2)
+    raise RuntimeError(f"server not ready: {url}")
+
+
+def _next_request(rng: random.Random, chat_ratio: float):
+    if rng.random() < chat_ratio:
+        return "chat", "POST", "/chat", {"json": {"question": rng.choice(CHAT_QUESTIONS)}}
+    return "search", "GET", "/notices/search", {"params": {"q": rng.choice(SEARCH_QUERIES)}}
+
+
+async def drive(base_url: str, args):
+    """오픈 루프 부하 생성. 지연은 예정 발사 시각 기준(coordinated omission 방지)."""
+    rng = random.Random(args.seed)
+    results = []
+    in_flight = set()
+    client_lag = []
+    server_lag = defaultdict(list)
+    stop = asyncio.Event()
+
+    limits = httpx.Limits(max_connections=args.max_in_flight, max_keepalive_connections=args.max_in_flight)
+    async with httpx.AsyncClient(base_url=base_url, timeout=args.timeout, limits=limits) as client:
+
+        async def fire(kind, method, path, kw, scheduled, measured):
+            status, error = None, None
+            try:
+                resp = await client.request(method, path, **kw)
+                status = resp.status_code
+            except Exception as e:
+                error = type(e).__name__
+            if measured:
+                latency = (time.perf_counter() - scheduled) * 1000
+                results.append((kind, latency, status, error))
+
+        async def watch_client_lag():
+            while not stop.is_set():
+                t = time.perf_counter()
+                await asyncio.sleep(0.05)
+                if t >= measure_from:
+                    client_lag.append((time.perf_counter() - t - 0.05) * 1000)
+
+        async def poll_lag_once(probe):
+            """새 연결로 한 번 조회(keep-alive 재사용 시 항상 같은 워커로 감)."""
+            body = (await probe.get("/__loadtest/loop-lag")).json()
+            samples = server_lag[body["pid"]]
+            samples.extend(
+                lag for ts, lag in body["samples_ms"] if window[0] <= ts <= window[1]
+            )
+            return body["pid"]
+
+        async def poll_server_lag(probe):
+            while not stop.is_set():
+                try:
+                    await poll_lag_once(probe)
+                except Exception:
+                    pass
+                await asyncio.sleep(0.5)
+
+        async def drain_server_lag(probe, deadline_sec: float = 10):
+            """측정 종료 후 모든 워커가 한 번씩 응답할 때까지 남은 샘플 수거."""
+            deadline = time.monotonic() + deadline_sec
+            reported = set()
+            while len(reported) < args.workers and time.monotonic() < deadline:
+                try:
+                    reported.add(await poll_lag_once(probe))
+                except Exception:
+                    await asyncio.sleep(0.05)
+
+        # 워밍업·종료 후 샘플은 제외(서버 샘플은 epoch초 기준)
+        dropped = 0
+        start = time.perf_counter()
+        measure_from = start + args.warmup
+        end = measure_from + args.duration
+        window = [time.time() + args.warmup, math.inf]
+
+        probe = httpx.AsyncClient(
+            base_url=base_url,
+            timeout=5,
+            limits=httpx.Limits(max_keepalive_connections=0),
+            headers={"Connection": "close"},
+        )
+        watchers = [
+            asyncio.create_task(watch_client_lag()),
+            asyncio.create_task(poll_server_lag(probe)),
+        ]
+        next_at = start
+        while next_at < end:
+            now = time.perf_counter()
+            if next_at > now:
+                await asyncio.sleep(next_at - now)
+            measured = next_at >= measure_from
+            if len(in_flight) >= args.max_in_flight:
+                dropped += measured
+            else:
+                kind, method, path, kw = _next_request(rng, args.chat_ratio)
+                task = asyncio.create_task(fire(kind, method, path, kw, next_at, measured))
+                in_flight.add(task)
+                task.add_done_callback(in_flight.discard)
+            next_at += rng.expovariate(args.rps)
+
+        sent_until = time.perf_counter()
+        if in_flight:
+            await asyncio.wait(in_flight, timeout=args.timeout)
+        window[1] = time.time()
+        stop.set()
+        await asyncio.gather(*watchers, return_exceptions=True)
+        await drain_server_lag(probe)
+        await probe.aclose()
+
+    return results, dropped, sent_until - measure_from, client_lag, server_lag
+
+
+def report(args, results, dropped, elapsed, client_lag, server_lag):
+    by_kind = defaultdict(list)
+    for kind, latency, status, error in results:
+        by_kind[kind].append((latency, status, error))
+
+    def block(rows):
+        ok = [lat for lat, status, error in rows if error is None and status and status < 400]
+        errors = Counter(
+            error or str(status) for _, status, error in rows if error or not status or status >= 400
+        )
+        total = len(rows)
+        return {
+            "requests": total,
+            "ok": len(ok),
+            "throughput_rps": round(len(ok) / elapsed, 2) if elapsed else None,
+            "error_rate": round((total - len(ok)) / total, 4) if total else None,
+            "errors": dict(errors),
+            "latency_ms": summarize_ms(ok),
+        }
+
+    all_rows = [row for rows in by_kind.values() for row in rows]
+    return {
+        "config": {
+            "target_rps": args.rps,
+            "duration_sec": args.duration,
+            "warmup_sec": args.warmup,
+            "workers": args.workers,
+            "chat_ratio": args.chat_ratio,
+            "stub_ttft_ms": args.stub_ttft_ms,
+            "stub_token_ms": args.stub_token_ms,
+            "stub_tokens": args.stub_tokens,
+            "max_in_flight": args.max_in_flight,
+            "seed": args.seed,
+        },
+        "overall": {**block(all_rows), "dropped": dropped},
+        "endpoints": {kind: block(rows) for kind, rows in sorted(by_kind.items())},
+        "event_loop_lag_ms": {
+            "server": {str(pid): summarize_ms(v) for pid, v in sorted(server_lag.items())},
+            "client": summarize_ms(client_lag),
+        },
+    }
+
+
+async def main(args):
+    database_url = loadtest_database_url(args.allow_remote)
+    if args.seed_count:
+        seed(args.seed_count, database_url)
+
+    stub = _spawn(
+        "loadtest.stub_llm:app",
+        args.stub_port,
+        {
+            "STUB_TTFT_MS": str(args.stub_ttft_ms),
+            "STUB_TOKEN_MS": str(args.stub_token_ms),
+            "STUB_TOKENS": str(args.stub_tokens),
+        },
+    )
+    app = _spawn(
+        "loadtest.app:app",
+        args.app_port,
+        {
+            "DATABASE_URL": database_url,
+            "UPSTAGE_API_KEY": "loadtest",
+            "UPSTAGE_BASE_URL": f"http://127.0.0.1:{args.stub_port}",
+        },
+        workers=args.workers,
+    )
+    try:
+        base_url = f"http://127.0.0.1:{args.app_port}"
+        await _wait_ready(f"http://127.0.0.1:{args.stub_port}/docs")
+        await _wait_ready(f"{base_url}/health")
+        out = report(args, *await drive(base_url, args))
+    finally:
+        for proc in (app, stub):
+            proc.terminate()
+            proc.wait(timeout=10)
+
+    text = json.dumps(out, ensure_ascii=False, indent=2)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    print(text)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rps", type=float, default=10, help="목표 요청/초")
+    parser.add_argument("--duration", type=float, default=60, help="측정 구간(초)")
+    parser.add_argument("--warmup", type=float, default=5, help="측정 제외 워밍업(초)")
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn 워커 수")
+    parser.add_argument("--chat-ratio", type=float, default=0.7, help="/chat 요청 비율")
+    parser.add_argument("--stub-ttft-ms", type=float, default=300)
+    parser.add_argument("--stub-token-ms", type=float, default=20)
+    parser.add_argument("--stub-tokens", type=int, default=150)
+    parser.add_argument("--seed-count", type=int, default=0, help="시드할 합성 공지 수(0이면 생략)")
+    parser.add_argument("--max-in-flight", type=int, default=1000)
+    parser.add_argument("--timeout", type=float, default=60)
+    parser.add_argument("--app-port", type=int, default=8100)
+    parser.add_argument("--stub-port", type=int, default=8101)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--allow-remote", action="store_true", help="원격 DB 허용")
+    parser.add_argument("--out", help="결과 JSON 저장 경로")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+부하 테스트용 로컬 DB 시드 스크립트
+- notices 테이블 생성(없을 때만)
+- 합성 공지 N개 삽입 (url이 loadtest:// 로 시작, 재실행 시 교체)
+
+DB는 .env의 DATABASE_URL이 아니라 LOADTEST_DATABASE_URL만 사용하며,
+로컬(localhost/127.0.0.1/소켓)이 아니면 --allow-remote 없이는 거부한다.
+
+사용: LOADTEST_DATABASE_URL=postgresql://localhost/asknu_load python -m loadtest.seed --count 3000
+"""
+
+import os
+import argparse
+import random
+import datetime as dt
+
+import psycopg2
+from psycopg2.extensions import parse_dsn
+from psycopg2.extras import execute_values
+
+LOCAL_HOSTS = {"", "localhost", "127.0.0.1", "::1"}
+
+SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS notices (
+    id SERIAL PRIMARY KEY,
+    source VARCHAR(50) DEFAULT 'cse',
+    url TEXT UNIQUE NOT NULL,
+    title TEXT NOT NULL,
+    content TEXT,
+    posted_at TIMESTAMP WITH TIME ZONE,
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+    summary TEXT,
+    checksum VARCHAR(64)
+)
+"""
+
+TOPICS = {
+    "수강신청": ["수강신청 일정", "수강정정 기간", "수강신청 유의사항"],
+    "졸업": ["졸업요건 확인", "졸업논문 제출", "졸업사정 결과"],
+    "장학금": ["국가장학금 신청", "교내 장학생 선발", "성적우수 장학금"],
+    "계절학기": ["계절학기 수강신청", "계절학기 개설 교과목", "계절학기 등록금 납부"],
+    "채용": ["채용설명회", "인턴십 모집", "채용연계형 현장실습"],
+    "경진대회": ["SW 경진대회 참가자 모집", "해커톤 개최", "캡스톤디자인 경진대회"],
+    "특강": ["AI 특강", "진로 특강", "보안 세미나"],
+}
+FILLER = (
+    "신청 대상은 컴퓨터학부 재학생이며 기간 내에 학과 사무실 또는 온라인으로 "
+    "신청하시기 바랍니다. 자세한 사항은 첨부파일을 참고하시기 바랍니다. "
+)
+
+
+def synthetic_notices(count: int, seed: int = 42):
+    """합성 공지 생성(최근 3년에 고르게 분포)."""
+    rng = random.Random(seed)
+    now = dt.datetime.now()
+    rows = []
+    for i in range(count):
+        topic = rng.choice(list(TOPICS))
+        headline = rng.choice(TOPICS[topic])
+        year = now.year - rng.randint(0, 2)
+        title = f"[{topic}] {year}학년도 {headline} 안내"
+        content = f"{title}. " + FILLER * rng.randint(2, 12)
+        posted_at = now - dt.timedelta(days=rng.randint(0, 3 * 365))
+        summary = f"[요약] {title}\n- {headline} 관련 일정과 신청 방법 안내."
+        rows.append(
+            (f"loadtest://notice/{i}", title, content, posted_at, summary, f"{i:040x}")
+        )
+    return rows
+
+
+def loadtest_database_url(allow_remote: bool = False) -> str:
+    """LOADTEST_DATABASE_URL 확인(없거나 원격이면 SystemExit)."""
+    url = os.getenv("LOADTEST_DATABASE_URL")
+    if not url:
+        raise SystemExit("LOADTEST_DATABASE_URL not set (로컬 PostgreSQL URL 필요)")
+    hosts = parse_dsn(url).get("host", "").split(",")
+    remote = [h for h in hosts if h not in LOCAL_HOSTS and not h.startswith("/")]
+    if remote and not allow_remote:
+        raise SystemExit(
+            f"LOADTEST_DATABASE_URL host {remote[0]!r} is not local; "
+            "use --allow-remote to run against it anyway"
+        )
+    return url
+
+
+def seed(count: int, database_url: str):
+    conn = psycopg2.connect(database_url)
+    cur = conn.cursor()
+    cur.execute(SCHEMA_SQL)
+    cur.execute("DELETE FROM notices WHERE url LIKE 'loadtest://%%'")
+    execute_values(
+        cur,
+        """
+        INSERT INTO notices (source, url, title, content, posted_at, updated_at, summary, checksum)
+        VALUES %s
+        """,
+        synthetic_notices(count),
+        template="('cse', %s, %s, %s, %s, now(), %s, %s)",
+        page_size=1000,
+    )
+    conn.commit()
+    cur.execute("ANALYZE notices")
+    conn.commit()
+    cur.close()
+    conn.close()
+    print(f"✅ 합성 공지 {count:,}개 삽입 완료")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=3000)
+    parser.add_argument("--allow-remote", action="store_true", help="원격 DB 허용")
+    args = parser.parse_args()
+    seed(args.count, loadtest_database_url(args.allow_remote))
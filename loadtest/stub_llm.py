@@ -0,0 +1,56 @@
+# loadtest/stub_llm.py
+"""
+OpenAI 호환 LLM 스텁 서버 (부하 테스트용)
+- POST /chat/completions : 첫 토큰 지연 + 토큰당 지연 후 고정 형식 답변
+- 지연은 환경변수로 조절: STUB_TTFT_MS, STUB_TOKEN_MS, STUB_TOKENS
+"""
+
+import os
+import time
+import asyncio
+
+from fastapi import FastAPI, Request
+
+TTFT_MS = float(os.getenv("STUB_TTFT_MS", "300"))
+TOKEN_MS = float(os.getenv("STUB_TOKEN_MS", "20"))
+TOKENS = int(os.getenv("STUB_TOKENS", "150"))
+
+ANSWER = """\
+[요약 안내]
+부하 테스트용 스텁 답변입니다.
+
+[일정]
+- 2025.01.01 ~ 2025.01.31
+
+[관련 공지]
+- 스텁 공지
+(https://example.invalid/notice)
+"""
+
+app = FastAPI(title="AsKNU LLM stub")
+
+
+@app.post("/chat/completions")
+async def chat_completions(request: Request):
+    """설정된 지연만큼 기다린 뒤 chat.completion 응답."""
+    body = await request.json()
+    prompt_chars = sum(len(m.get("content") or "") for m in body.get("messages", []))
+    await asyncio.sleep((TTFT_MS + TOKEN_MS * TOKENS) / 1000)
+    return {
+        "id": "chatcmpl-stub",
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": body.get("model", "stub"),
+        "choices": [
+            {
+                "index": 0,
+                "message": {"role": "assistant", "content": ANSWER},
+                "finish_reason": "stop",
+            }
+        ],
+        "usage": {
+            "prompt_tokens": prompt_chars // 2,
+            "completion_tokens": TOKENS,
+            "total_tokens": prompt_chars // 2 + TOKENS,
+        },
+    }
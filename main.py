@@ -5,13 +5,31 @@ load_dotenv()
 
 import os
 import asyncio
-from fastapi import FastAPI, Query, HTTPException
+from urllib.parse import quote
+
+import anyio
+from fastapi import FastAPI, Query, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 
 from crawler import fetch_html, parse_detail, checksum, collect_all_items
-from db import upsert_notice, find_by_query, get_conn
-from summarizer import summarize_notice, answer_with_gemini
+from db import (
+    upsert_notice,
+    find_by_query,
+    get_conn,
+    get_notice_full,
+    corpus_version,
+    search_cutoff,
+)
+from http_cache import not_modified, cached_json
+import suggest
+from answer_cards import (
+    ANSWER_CARD_YEARS,
+    build_citations,
+    get_card,
+    precompute_answer_cards,
+)
+from summarizer import summarize_notice, answer_with_gemini, llm_stats
 
 BASE_BOARD = os.getenv("BASE_BOARD")
 
@@ -63,42 +81,58 @@ def db_ping():
         return {"db": "error", "detail": repr(e)}
 
 
+@app.get("/stats/llm")
+def stats_llm():
+    """최근 답변 생성의 프롬프트 토큰·지연 통계(컨텍스트 예산 튜닝용)."""
+    return llm_stats()
+
+
 @app.post("/refresh")
-async def refresh(max_pages: int | None = Query(None, ge=1)):
-    """공지 전체/일부 페이지 수집 → 요약 → DB 저장."""
+async def refresh(max_pages: int | None = Query(None, ge=1), precompute: bool = True):
+    """공지 전체/일부 페이지 수집 → 요약 → DB 저장 → 주요 주제 답변 사전 계산."""
     if not BASE_BOARD:
         raise HTTPException(500, "BASE_BOARD not configured")
 
     items = await collect_all_items(BASE_BOARD, max_pages=max_pages, delay_sec=0.4)
     saved, skipped, errors = 0, 0, []
 
-    for it in items:
-        try:
-            detail_html = await fetch_html(it["url"])
-            content, posted_at = parse_detail(detail_html)
-            if not content or len(content) < 30:
+    suggest.begin_writes()
+    try:
+        for it in items:
+            try:
+                detail_html = await fetch_html(it["url"])
+                content, posted_at = parse_detail(detail_html)
+                if not content or len(content) < 30:
+                    skipped += 1
+                    if len(errors) < 5:
+                        errors.append({"url": it.get("url"), "error": "content_too_short"})
+                    continue
+
+                summary = await summarize_notice(it["title"], content)
+                saved_row = upsert_notice(
+                    {
+                        "url": it["url"],
+                        "title": it["title"],
+                        "content": content,
+                        "posted_at": posted_at,
+                        "summary": summary,
+                        "checksum": checksum(content),
+                    }
+                )
+                await anyio.to_thread.run_sync(
+                    suggest.add_notice, saved_row[0], it["title"], saved_row[1]
+                )
+                saved += 1
+                await asyncio.sleep(0.2)
+            except Exception as e:
                 skipped += 1
                 if len(errors) < 5:
-                    errors.append({"url": it.get("url"), "error": "content_too_short"})
-                continue
-
-            summary = await summarize_notice(it["title"], content)
-            upsert_notice(
-                {
-                    "url": it["url"],
-                    "title": it["title"],
-                    "content": content,
-                    "posted_at": posted_at,
-                    "summary": summary,
-                    "checksum": checksum(content),
-                }
-            )
-            saved += 1
-            await asyncio.sleep(0.2)
-        except Exception as e:
-            skipped += 1
-            if len(errors) < 5:
-                errors.append({"url": it.get("url"), "error": repr(e)})
+                    errors.append({"url": it.get("url"), "error": repr(e)})
+    finally:
+        # 진행 중엔 delta로 최신 유지, 끝나면 정리 + 현재 코퍼스 버전 기록
+        suggest.mark_synced(corpus_version)
+
+    cards = await precompute_answer_cards() if precompute else None
 
     return {
         "status": "ok",
@@ -106,19 +140,68 @@ async def refresh(max_pages: int | None = Query(None, ge=1)):
         "skipped": skipped,
         "count": len(items),
         "sample_errors": errors,
+        "answer_cards": cards,
     }
 
 
 @app.get("/notices/search")
-def search(q: str = Query(..., min_length=1), limit: int = 5, years: int = 3):
-    """키워드 검색(제목 우선·최신순)."""
+def search(
+    request: Request,
+    q: str = Query(..., min_length=1),
+    limit: int = 5,
+    years: int = 3,
+):
+    """키워드 검색(제목 우선·최신순). ETag 일치 시 304.
+
+    결과가 기간 하한(오늘 - years)에 따라 달라지므로 하한 날짜도 ETag에 넣는다.
+    """
+    resp, etag = not_modified(
+        request, version=f"{corpus_version()}|{search_cutoff(years)}"
+    )
+    if resp:
+        return resp
     rows = find_by_query(q, limit=limit, since_years=years)
-    return {"results": rows}
+    return cached_json({"results": rows}, etag)
+
+
+@app.get("/notices/suggest")
+def suggest_titles(
+    request: Request,
+    q: str = Query(..., min_length=1),
+    limit: int = Query(8, ge=1, le=20),
+):
+    """입력 중 제목 추천(접두어·초성, 최신순). 메모리 인덱스 사용.
+
+    ETag는 인덱스가 실제 반영한 버전으로 만든다(코퍼스보다 늦을 수 있음).
+    """
+    index = suggest.get_index(corpus_version())
+    resp, etag = not_modified(request, version=index.served_version())
+    if resp:
+        return resp
+    return cached_json({"results": index.suggest(q, limit=limit)}, etag)
+
+
+@app.get("/notices/{notice_id}")
+def notice_detail(request: Request, notice_id: int):
+    """공지 단건 상세. ETag 일치 시 304."""
+    resp, etag = not_modified(request)
+    if resp:
+        return resp
+    row = get_notice_full(notice_id)
+    if not row:
+        raise HTTPException(404, "notice not found")
+    return cached_json(row, etag)
 
 
 @app.post("/chat")
-async def chat(payload: ChatRequest, years: int = 3):
-    """질문 → 검색 상위 N → Gemini로 답변 생성."""
+async def chat(payload: ChatRequest, response: Response, years: int = 3):
+    """질문 → (주요 주제면 사전 계산 답변) 또는 검색 상위 N → Gemini로 답변 생성."""
+    if years == ANSWER_CARD_YEARS:
+        card = await anyio.to_thread.run_sync(get_card, payload.question)
+        if card:
+            response.headers["X-Answer-Card"] = quote(card["topic"])
+            return {"answer": card["answer"], "citations": card["citations"]}
+
     rows = find_by_query(payload.question, limit=5, since_years=years)
     if not rows:
         return {
@@ -127,13 +210,4 @@ async def chat(payload: ChatRequest, years: int = 3):
         }
 
     answer = await answer_with_gemini(payload.question, rows)
-    citations = [
-        {
-            "title": r["title"],
-            "url": r["url"],
-            "posted_at": r["posted_at"],
-            "summary": r.get("summary") or "",
-        }
-        for r in rows
-    ]
-    return {"answer": answer, "citations": citations}
+    return {"answer": answer, "citations": build_citations(rows)}
@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+"""
+공지 데이터 정리 작업
+- 잘못된 게시일(미래 날짜·NULL)은 삭제하지 않고 원문 재수집·재파싱으로 보정
+  (보정 불가 건은 그대로 두고 id만 보고)
+- 보존 기간(상대 기준)이 지난 공지는 배치 단위로 아카이브 또는 삭제
+- 작업 후 VACUUM ANALYZE로 통계 갱신
+- 연도별 분포는 한 번의 집계 스캔으로 출력
+
+모든 날짜 조건은 posted_at 범위 비교라 posted_at 인덱스를 탈 수 있다.
+
+사용: python maintenance.py --retention-years 15 --action archive --batch-size 500
+"""
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+import time
+import asyncio
+import argparse
+import datetime as dt
+
+from dateutil.relativedelta import relativedelta
+from psycopg2.extras import execute_values
+
+from crawler import fetch_html, parse_detail, parse_posted_at
+from db import get_conn
+
+INDEX_SQL = "CREATE INDEX CONCURRENTLY IF NOT EXISTS notices_posted_at_idx ON notices (posted_at)"
+ARCHIVE_SQL = "CREATE TABLE IF NOT EXISTS notices_archive (LIKE notices)"
+
+
+def print_distribution(cur, label: str):
+    """연도별 분포·총계·최소/최대를 한 번의 스캔으로 집계해 출력."""
+    cur.execute(
+        """
+        SELECT EXTRACT(YEAR FROM posted_at)::int AS year,
+               COUNT(*) AS count,
+               MIN(posted_at) AS oldest,
+               MAX(posted_at) AS newest
+        FROM notices
+        GROUP BY 1
+        ORDER BY 1 DESC NULLS LAST
+    """
+    )
+    rows = cur.fetchall()
+    dated = [r for r in rows if r[0] is not None]
+    total = sum(r[1] for r in rows)
+    nulls = sum(r[1] for r in rows if r[0] is None)
+
+    print(f"📊 {label}:")
+    print(f"  총 공지: {total:,}개 (날짜 없음 {nulls:,}개)")
+    if dated:
+        print(f"  가장 오래된 공지: {min(r[2] for r in dated)}")
+        print(f"  가장 최근 공지: {max(r[3] for r in dated)}")
+    for year, count, _, _ in dated:
+        print(f"  {year}년: {count:,}개")
+    print()
+
+
+def _valid(posted_at, future):
+    return posted_at is not None and posted_at <= future
+
+
+async def _refetch_dates(urls, delay_sec: float = 0.4):
+    """상세 페이지를 다시 받아 게시일 재파싱."""
+    out = {}
+    for url in urls:
+        try:
+            _, posted_at = parse_detail(await fetch_html(url))
+            out[url] = posted_at
+        except Exception:
+            out[url] = None
+        await asyncio.sleep(delay_sec)
+    return out
+
+
+def repair_dates(conn, future, batch_size: int, refetch: bool, dry_run: bool):
+    """미래/NULL 게시일을 원문 상세 페이지(parse_detail과 같은 헤더)에서 재파싱해 보정.
+
+    refetch=False면 제목·본문에서 찾는다(마감일 등 다른 날짜를 집을 수 있어 보조용).
+    유효한 날짜를 못 찾은 공지는 바꾸지 않고(NULL로 만들면 검색에서 빠지므로)
+    수동 확인용으로 id 목록을 반환한다.
+    """
+    cur = conn.cursor()
+    fixed, unresolved, after = 0, [], 0
+    while True:
+        cur.execute(
+            """
+            SELECT id, url, title, content, posted_at
+            FROM notices
+            WHERE (posted_at > %(future)s OR posted_at IS NULL) AND id > %(after)s
+            ORDER BY id
+            LIMIT %(batch)s
+        """,
+            {"future": future, "after": after, "batch": batch_size},
+        )
+        rows = cur.fetchall()
+        if not rows:
+            break
+        after = rows[-1][0]
+
+        if refetch:
+            fetched = asyncio.run(_refetch_dates([url for _, url, *_ in rows]))
+            reparsed = {id_: fetched[url] for id_, url, *_ in rows}
+        else:
+            reparsed = {
+                id_: parse_posted_at(f"{title} {content or ''}")
+                for id_, _, title, content, _ in rows
+            }
+
+        updates = []
+        for id_, *_ in rows:
+            new = reparsed[id_]
+            if _valid(new, future):
+                updates.append((id_, new))
+                fixed += 1
+            else:
+                unresolved.append(id_)
+
+        if updates and not dry_run:
+            execute_values(
+                cur,
+                """
+                UPDATE notices AS n
+                SET posted_at = v.posted_at::timestamptz, updated_at = now()
+                FROM (VALUES %s) AS v(id, posted_at)
+                WHERE n.id = v.id
+                """,
+                updates,
+            )
+        conn.commit()
+
+    cur.close()
+    return fixed, unresolved
+
+
+def expire_old(conn, cutoff, batch_size: int, action: str, pause_sec: float, dry_run: bool):
+    """보존 기간 지난 공지를 배치 단위(짧은 트랜잭션)로 아카이브/삭제."""
+    cur = conn.cursor()
+    if dry_run:
+        cur.execute("SELECT COUNT(*) FROM notices WHERE posted_at < %s", (cutoff,))
+        count = cur.fetchone()[0]
+        cur.close()
+        return count
+
+    if action == "archive":
+        cur.execute(ARCHIVE_SQL)
+        conn.commit()
+        sink = "INSERT INTO notices_archive SELECT * FROM moved"
+    else:
+        sink = "SELECT 1 FROM moved"
+
+    total = 0
+    while True:
+        cur.execute(
+            f"""
+            WITH doomed AS (
+              SELECT id FROM notices
+              WHERE posted_at < %(cutoff)s
+              ORDER BY posted_at
+              LIMIT %(batch)s
+              FOR UPDATE SKIP LOCKED
+            ), moved AS (
+              DELETE FROM notices n USING doomed d
+              WHERE n.id = d.id
+              RETURNING n.*
+            )
+            {sink}
+        """,
+            {"cutoff": cutoff, "batch": batch_size},
+        )
+        moved = cur.rowcount
+        conn.commit()
+        total += moved
+        if moved < batch_size:
+            break
+        if pause_sec:
+            time.sleep(pause_sec)
+
+    cur.close()
+    return total
+
+
+def run(args):
+    now = dt.datetime.now()
+    future = now + dt.timedelta(days=args.future_grace_days)
+    cutoff = now - relativedelta(years=args.retention_years)
+
+    conn = get_conn()
+    cur = conn.cursor()
+    print_distribution(cur, "정리 전 통계")
+    conn.commit()
+
+    if args.ensure_index:
+        conn.autocommit = True
+        cur.execute(INDEX_SQL)
+        conn.autocommit = False
+        print("🗂️  posted_at 인덱스 확인 완료")
+
+    mode = " (dry-run)" if args.dry_run else ""
+    print(f"🛠️  게시일 보정 중{mode}... (기준: > {future:%Y-%m-%d} 또는 NULL)")
+    fixed, unresolved = repair_dates(
+        conn, future, args.batch_size, not args.no_refetch, args.dry_run
+    )
+    print(f"  ✅ 재파싱 보정 {fixed:,}개, 보정 불가(변경 없음) {len(unresolved):,}개")
+    if unresolved:
+        shown = ", ".join(map(str, unresolved[:50]))
+        more = f" 외 {len(unresolved) - 50:,}개" if len(unresolved) > 50 else ""
+        print(f"  ⚠️  수동 확인 필요 id: {shown}{more}")
+
+    verb = "아카이브" if args.action == "archive" else "삭제"
+    print(f"🗑️  보존 기간 경과 공지 {verb} 중{mode}... (기준: < {cutoff:%Y-%m-%d})")
+    expired = expire_old(
+        conn, cutoff, args.batch_size, args.action, args.pause_sec, args.dry_run
+    )
+    print(f"  ✅ {expired:,}개 {'대상' if args.dry_run else verb + '됨'}")
+    print()
+
+    if not args.dry_run:
+        conn.autocommit = True
+        cur.execute("VACUUM (ANALYZE) notices")
+        if args.action == "archive" and expired:
+            cur.execute("ANALYZE notices_archive")
+        conn.autocommit = False
+        print("📈 플래너 통계 갱신 완료 (VACUUM ANALYZE)")
+        print()
+        print_distribution(cur, "정리 후 통계")
+
+    cur.close()
+    conn.close()
+    print("✅ 데이터 정리 완료!")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--retention-years", type=int, default=15, help="보존 기간(년)")
+    parser.add_argument("--future-grace-days", type=int, default=1, help="미래 날짜 허용 오차(일)")
+    parser.add_argument("--action", choices=["archive", "delete"], default="archive")
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--pause-sec", type=float, default=0.1, help="배치 사이 대기(초)")
+    parser.add_argument(
+        "--no-refetch", action="store_true", help="원문 재수집 없이 제목·본문에서만 재파싱"
+    )
+    parser.add_argument("--ensure-index", action="store_true", help="posted_at 인덱스 생성")
+    parser.add_argument("--dry-run", action="store_true", help="변경 없이 대상 건수만 출력")
+    run(parser.parse_args())
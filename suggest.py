@@ -0,0 +1,303 @@
+# suggest.py
+import os
+import re
+import heapq
+import bisect
+import time
+import threading
+from array import array
+
+SUGGEST_DELTA_MAX = int(os.getenv("SUGGEST_DELTA_MAX", "128"))
+SUGGEST_REBUILD_INTERVAL = float(os.getenv("SUGGEST_REBUILD_INTERVAL", "60"))
+
+HANGUL_BASE, HANGUL_END = 0xAC00, 0xD7A3
+CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+JONGSEONG = [
+    "", "ㄱ", "ㄲ", "ㄳ", "ㄴ", "ㄵ", "ㄶ", "ㄷ", "ㄹ", "ㄺ", "ㄻ", "ㄼ", "ㄽ", "ㄾ",
+    "ㄿ", "ㅀ", "ㅁ", "ㅂ", "ㅄ", "ㅅ", "ㅆ", "ㅇ", "ㅈ", "ㅊ", "ㅋ", "ㅌ", "ㅍ", "ㅎ",
+]
+# 겹받침 → (남는 받침, 다음 글자 초성)
+SPLIT_JONG = {
+    "ㄳ": ("ㄱ", "ㅅ"), "ㄵ": ("ㄴ", "ㅈ"), "ㄶ": ("ㄴ", "ㅎ"), "ㄺ": ("ㄹ", "ㄱ"),
+    "ㄻ": ("ㄹ", "ㅁ"), "ㄼ": ("ㄹ", "ㅂ"), "ㄽ": ("ㄹ", "ㅅ"), "ㄾ": ("ㄹ", "ㅌ"),
+    "ㄿ": ("ㄹ", "ㅍ"), "ㅀ": ("ㄹ", "ㅎ"), "ㅄ": ("ㅂ", "ㅅ"),
+}
+KEY_END = "\U0010ffff"
+
+
+def _tokens(s: str):
+    """추천용 토큰 분리(소문자, 호환 자모 포함)."""
+    return re.findall(r"[가-힣ㄱ-ㅎa-z0-9]+", s.lower())
+
+
+def _choseong(s: str) -> str:
+    """완성형 음절을 초성으로 변환(그 외 문자는 유지)."""
+    out = []
+    for ch in s:
+        code = ord(ch)
+        if HANGUL_BASE <= code <= HANGUL_END:
+            out.append(CHOSEONG[(code - HANGUL_BASE) // 588])
+        else:
+            out.append(ch)
+    return "".join(out)
+
+
+def _cho_block(cho: str):
+    """초성 하나로 시작하는 음절 구간 [lo, hi)."""
+    i = CHOSEONG.index(cho)
+    return chr(HANGUL_BASE + i * 588), chr(HANGUL_BASE + (i + 1) * 588)
+
+
+def title_keys(title: str) -> set[str]:
+    """제목 전체(공백 제거)·토큰 및 각각의 초성 키."""
+    toks = _tokens(title)
+    keys = set(toks)
+    if toks:
+        keys.add("".join(toks))
+    keys |= {_choseong(k) for k in list(keys)}
+    return keys
+
+
+def query_ranges(q: str):
+    """입력 중인 질의어에 대응하는 키 구간 목록 [lo, hi).
+
+    마지막 글자가 조합 중일 수 있으므로
+    - 받침 없는 음절('자')은 같은 초·중성의 모든 음절('작', '장', ...)로,
+    - 받침 있는 음절('장')은 받침을 다음 글자 초성으로 넘긴 경우('자'+'ㅇ...')까지,
+    - 초성 자모('ㅈ')는 해당 초성의 모든 음절로 확장한다.
+    """
+    q = "".join(_tokens(q))
+    if not q:
+        return []
+    head, last = q[:-1], q[-1]
+    code = ord(last)
+    ranges = []
+    if HANGUL_BASE <= code <= HANGUL_END:
+        jong = (code - HANGUL_BASE) % 28
+        if jong == 0:
+            return [(head + last, head + chr(code + 28))]
+        ranges.append((q, q + KEY_END))
+        rest, cho = SPLIT_JONG.get(JONGSEONG[jong], ("", JONGSEONG[jong]))
+        if cho in CHOSEONG:
+            stem = head + chr(code - jong + JONGSEONG.index(rest))
+            lo, hi = _cho_block(cho)
+            ranges.append((stem + lo, stem + hi))
+        return ranges
+    ranges.append((q, q + KEY_END))
+    if last in CHOSEONG:
+        lo, hi = _cho_block(last)
+        ranges.append((head + lo, head + hi))
+    return ranges
+
+
+def _recency(posted_at):
+    """최신순 정렬 키(날짜 없음은 가장 오래된 것으로)."""
+    return posted_at.timestamp() if posted_at else float("-inf")
+
+
+class SuggestIndex:
+    """제목 접두어 추천 인덱스.
+
+    정렬된 키 배열 + 구간 최소(rank) 세그먼트 트리. rank 0이 가장 최신 공지라서
+    구간 최소를 차례로 꺼내면 매칭 건수와 무관하게 최신순 상위 k개를 얻는다.
+    본 인덱스는 생성 후 바꾸지 않고, refresh로 들어온 공지는 작은 delta에
+    쌓았다가 일정 크기를 넘으면 새 인덱스로 교체한다.
+    """
+
+    def __init__(self, docs=(), version=None):
+        self.version = version
+        self.built_at = time.monotonic()
+        self._lock = threading.Lock()
+        self._delta = {}
+        self._seq = 0
+        self._build(docs)
+
+    def _build(self, docs):
+        docs = sorted(docs, key=lambda d: _recency(d["posted_at"]), reverse=True)
+        self.docs = [(d["id"], d["title"], d["posted_at"]) for d in docs]
+        self._rank = {d[0]: r for r, d in enumerate(self.docs)}
+
+        entries = sorted(
+            (k, r) for r, (_, title, _) in enumerate(self.docs) for k in title_keys(title)
+        )
+        self.keys = [k for k, _ in entries]
+        self.ranks = array("i", (r for _, r in entries))
+
+        n = len(self.keys)
+        size = 1
+        while size < max(n, 1):
+            size *= 2
+        self._size = size
+        tree = array("i", [-1]) * (2 * size)
+        tree[size : size + n] = array("i", range(n))
+        ranks = self.ranks
+        for i in range(size - 1, 0, -1):
+            a, b = tree[2 * i], tree[2 * i + 1]
+            if b == -1 or (a != -1 and ranks[a] <= ranks[b]):
+                tree[i] = a
+            else:
+                tree[i] = b
+        self._tree = tree
+
+    def _argmin(self, lo: int, hi: int) -> int:
+        """[lo, hi) 구간에서 rank가 가장 작은 위치."""
+        tree, ranks = self._tree, self.ranks
+        best = -1
+        lo += self._size
+        hi += self._size
+        while lo < hi:
+            if lo & 1:
+                p = tree[lo]
+                if best == -1 or ranks[p] < ranks[best]:
+                    best = p
+                lo += 1
+            if hi & 1:
+                hi -= 1
+                p = tree[hi]
+                if best == -1 or ranks[p] < ranks[best]:
+                    best = p
+            lo >>= 1
+            hi >>= 1
+        return best
+
+    def _top_main(self, ranges, limit: int, skip: set):
+        """본 인덱스에서 최신순 상위 limit개 rank."""
+        heap = []
+
+        def push(lo, hi):
+            if lo < hi:
+                p = self._argmin(lo, hi)
+                heapq.heappush(heap, (self.ranks[p], p, lo, hi))
+
+        for lo_key, hi_key in ranges:
+            push(
+                bisect.bisect_left(self.keys, lo_key),
+                bisect.bisect_left(self.keys, hi_key),
+            )
+
+        out, seen = [], set()
+        while heap and len(out) < limit:
+            rank, p, lo, hi = heapq.heappop(heap)
+            push(lo, p)
+            push(p + 1, hi)
+            if rank in seen:
+                continue
+            seen.add(rank)
+            if self.docs[rank][0] not in skip:
+                out.append(self.docs[rank])
+        return out
+
+    def add(self, id_: int, title: str, posted_at):
+        """refresh로 추가/갱신된 공지를 delta에 반영(본 인덱스와 같으면 무시)."""
+        rank = self._rank.get(id_)
+        unchanged = rank is not None and self.docs[rank] == (id_, title, posted_at)
+        with self._lock:
+            if unchanged and id_ not in self._delta:
+                return
+            self._delta[id_] = (id_, title, posted_at, title_keys(title))
+            self._seq += 1
+
+    def delta_size(self) -> int:
+        with self._lock:
+            return len(self._delta)
+
+    def served_version(self) -> str:
+        """이 인덱스가 실제로 반영한 상태(구성 시 코퍼스 버전 + delta 추가 횟수)."""
+        with self._lock:
+            return f"{self.version}+{self._seq}"
+
+    def compacted(self, force: bool = False) -> "SuggestIndex":
+        """delta가 SUGGEST_DELTA_MAX를 넘으면 합쳐서 새 인덱스로 재구성."""
+        with self._lock:
+            delta, seq = dict(self._delta), self._seq
+        if not delta or (not force and len(delta) < SUGGEST_DELTA_MAX):
+            return self
+        merged = {d[0]: d for d in self.docs}
+        merged.update({k: v[:3] for k, v in delta.items()})
+        index = SuggestIndex(
+            ({"id": i, "title": t, "posted_at": p} for i, t, p in merged.values()),
+            version=self.version,
+        )
+        # 같은 served_version이 다른 내용을 가리키지 않도록 추가 횟수는 이어감
+        index._seq = seq
+        return index
+
+    def suggest(self, q: str, limit: int = 10):
+        """접두어(음절 조합 중·초성 포함) 매칭 제목을 최신순으로 반환."""
+        ranges = query_ranges(q)
+        if not ranges or limit <= 0:
+            return []
+        with self._lock:
+            delta = list(self._delta.values())
+
+        hits = [
+            d[:3]
+            for d in delta
+            if any(lo <= k < hi for k in d[3] for lo, hi in ranges)
+        ]
+        hits += self._top_main(ranges, limit, {d[0] for d in delta})
+        hits.sort(key=lambda d: _recency(d[2]), reverse=True)
+        return [{"id": i, "title": t, "posted_at": p} for i, t, p in hits[:limit]]
+
+
+_index = None
+_index_lock = threading.Lock()
+# 이 워커에서 진행 중인 refresh 수. 쓰는 쪽은 delta로 이미 최신이므로 재구성하지 않음
+_writers = 0
+
+
+def _stale(index, version) -> bool:
+    """다른 워커의 refresh 반영 필요 여부(재구성은 SUGGEST_REBUILD_INTERVAL당 1회)."""
+    if index is None:
+        return True
+    if version is None or index.version == version or _writers:
+        return False
+    return time.monotonic() - index.built_at >= SUGGEST_REBUILD_INTERVAL
+
+
+def get_index(version=None) -> SuggestIndex:
+    """추천 인덱스(지연 로딩). 코퍼스 버전이 바뀌면 DB에서 재구성."""
+    global _index
+    if not _stale(_index, version):
+        return _index
+    with _index_lock:
+        if _stale(_index, version):
+            from db import list_notice_titles
+
+            _index = SuggestIndex(list_notice_titles(), version=version)
+    return _index
+
+
+def begin_writes():
+    """refresh 시작: 끝날 때까지 버전 변경에 따른 DB 재구성을 건너뜀."""
+    global _writers
+    with _index_lock:
+        _writers += 1
+
+
+def add_notice(id_: int, title: str, posted_at):
+    """로드된 인덱스가 있으면 delta에 추가하고, SUGGEST_DELTA_MAX에 닿으면 바로 합침.
+
+    refresh 도중에도 delta 선형 탐색이 길어지지 않게 한다. 합치는 동안 다른 추가가
+    끼어들어 유실되지 않도록 _index_lock 안에서 처리한다(블로킹이므로 스레드에서 호출).
+    """
+    global _index
+    with _index_lock:
+        if _index is None:
+            return
+        _index.add(id_, title, posted_at)
+        if _index.delta_size() >= SUGGEST_DELTA_MAX:
+            _index = _index.compacted()
+
+
+def mark_synced(get_version):
+    """refresh 종료 후: 쓰기 표시 해제 + delta 정리 + 현재 코퍼스 버전 기록."""
+    global _index, _writers
+    with _index_lock:
+        _writers = max(0, _writers - 1)
+    version = get_version()
+    with _index_lock:
+        if _index is not None:
+            index = _index.compacted()
+            index.version = version
+            _index = index
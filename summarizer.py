@@ -1,6 +1,8 @@
 # summarizer.py
 
-import os, re, textwrap
+import os, re, math, time, textwrap, threading
+from collections import deque
+
 from openai import OpenAI
 from tenacity import (
     retry,
@@ -12,6 +14,12 @@ import anyio
 
 API_KEY = os.getenv("UPSTAGE_API_KEY")
 MODEL_NAME = os.getenv("UPSTAGE_MODEL", "solar-pro")
+BASE_URL = os.getenv("UPSTAGE_BASE_URL", "https://api.upstage.ai/v1/solar")
+CONTEXT_TOKEN_BUDGET = int(os.getenv("CONTEXT_TOKEN_BUDGET", "1500"))
+CONTEXT_DEDUP_THRESHOLD = float(os.getenv("CONTEXT_DEDUP_THRESHOLD", "0.8"))
+LLM_STATS_WINDOW = int(os.getenv("LLM_STATS_WINDOW", "500"))
+MIN_SUMMARY_TOKENS = 8
+SUMMARY_OVERHEAD = 3  # "\n  요약: "
 
 QA_TMPL = """\
 당신은 '경북대학교 컴퓨터학부 행정 안내 챗봇 AsKNU'입니다.
@@ -51,21 +59,146 @@ QA_TMPL = """\
 """
 
 
-def _format_contexts(rows):
-    blocks = []
+def _estimate_tokens(text: str) -> int:
+    """토큰 수 추정: 한글 음절 1개≈1토큰, 그 외 비공백 문자 4개≈1토큰."""
+    hangul = len(re.findall(r"[가-힣]", text))
+    other = len(re.findall(r"[^\s가-힣]", text))
+    return hangul + math.ceil(other / 4)
+
+
+def _shingles(text: str, k: int = 3) -> set[str]:
+    """공백 제거 후 문자 k-gram 집합."""
+    text = re.sub(r"\s+", "", text)
+    return {text[i : i + k] for i in range(max(1, len(text) - k + 1))}
+
+
+def _jaccard(a: set, b: set) -> float:
+    return len(a & b) / len(a | b) if a and b else 0.0
+
+
+def _strip_summary(r) -> str:
+    """저장된 요약의 '[요약] 제목' 머리말 제거(제목은 블록에 따로 들어감)."""
+    summary = (r.get("summary") or "").strip()
+    head = f"[요약] {r['title']}"
+    if summary.startswith(head):
+        summary = summary[len(head) :].lstrip("\n -")
+    return re.sub(r"\s+", " ", summary).strip()
+
+
+def _truncate_tokens(text: str, max_tokens: int) -> str:
+    """추정 토큰 max_tokens 이하로 자르되 문장/어절 경계에서 끊고 '…' 부착."""
+    if _estimate_tokens(text) <= max_tokens:
+        return text
+    lo, hi = 0, len(text)
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if _estimate_tokens(text[:mid]) <= max_tokens - 1:
+            lo = mid
+        else:
+            hi = mid - 1
+    cut = text[:lo]
+    boundary = max(cut.rfind(". ") + 1, cut.rfind(" "))
+    if boundary > len(cut) // 2:
+        cut = cut[:boundary]
+    return cut.rstrip(" ,.") + "…"
+
+
+def _format_contexts(rows, budget: int = CONTEXT_TOKEN_BUDGET):
+    """검색 순위대로 토큰 예산을 배분해 컨텍스트 구성.
+
+    - 제목+링크는 예산과 무관하게 항상 온전히 포함
+    - 앞선 요약과 shingle 유사도가 높은 요약은 생략
+    - 남은 예산은 순위 가중치(1/순위)로 요약에 배분, 쓰고 남은 몫은 다음 순위로 이월
+    반환: (컨텍스트 문자열, 추정 토큰 수, 중복 제거 건수)
+    """
+    summaries, kept_shingles, dups = [], [], 0
     for r in rows:
-        blocks.append(
-            f"- 제목: {r['title']}\n  요약: {r.get('summary') or ''}\n  링크: {r['url']}"
-        )
-    return "\n".join(blocks)
+        summary = _strip_summary(r)
+        sh = _shingles(summary) if summary else set()
+        if summary and any(
+            _jaccard(sh, prev) >= CONTEXT_DEDUP_THRESHOLD for prev in kept_shingles
+        ):
+            summary, dups = "", dups + 1
+        elif summary:
+            kept_shingles.append(sh)
+        summaries.append(summary)
+
+    heads = [f"- 제목: {r['title']}\n  링크: {r['url']}" for r in rows]
+    remaining = budget - sum(_estimate_tokens(h) for h in heads)
+
+    weights = [1 / (i + 1) if s else 0.0 for i, s in enumerate(summaries)]
+    allotted = []
+    for i, summary in enumerate(summaries):
+        share = 0
+        if summary and remaining > 0:
+            share = int(remaining * weights[i] / sum(weights[i:])) - SUMMARY_OVERHEAD
+        text = _truncate_tokens(summary, share) if share >= MIN_SUMMARY_TOKENS else ""
+        if text:
+            remaining -= _estimate_tokens(text) + SUMMARY_OVERHEAD
+        allotted.append(text)
+
+    blocks = []
+    for r, text in zip(rows, allotted):
+        if text:
+            blocks.append(f"- 제목: {r['title']}\n  요약: {text}\n  링크: {r['url']}")
+        else:
+            blocks.append(f"- 제목: {r['title']}\n  링크: {r['url']}")
+    contexts = "\n".join(blocks)
+    return contexts, _estimate_tokens(contexts), dups
+
+
+_stats_lock = threading.Lock()
+_llm_stats = deque(maxlen=LLM_STATS_WINDOW)
+
+
+def _record_stats(entry: dict):
+    with _stats_lock:
+        _llm_stats.append(entry)
+
+
+def _pct(values, p: float):
+    if not values:
+        return None
+    values = sorted(values)
+    return values[max(0, math.ceil(p / 100 * len(values)) - 1)]
+
+
+def llm_stats() -> dict:
+    """최근 LLM_STATS_WINDOW건의 프롬프트 토큰·응답 지연 통계(예산 튜닝용)."""
+    with _stats_lock:
+        entries = list(_llm_stats)
+    prompt = [e["prompt_tokens"] for e in entries if e["prompt_tokens"] is not None]
+    estimated = [e["context_tokens_est"] for e in entries]
+    latency = [e["latency_ms"] for e in entries]
+    ratio = [
+        e["prompt_tokens"] / e["prompt_tokens_est"]
+        for e in entries
+        if e["prompt_tokens"] and e["prompt_tokens_est"]
+    ]
+    return {
+        "count": len(entries),
+        "context_token_budget": CONTEXT_TOKEN_BUDGET,
+        "prompt_tokens": {
+            "p50": _pct(prompt, 50),
+            "p95": _pct(prompt, 95),
+            "max": max(prompt, default=None),
+        },
+        "context_tokens_est": {"p50": _pct(estimated, 50), "p95": _pct(estimated, 95)},
+        "completion_latency_ms": {
+            "p50": _pct(latency, 50),
+            "p95": _pct(latency, 95),
+            "p99": _pct(latency, 99),
+        },
+        "actual_to_estimate_ratio": round(sum(ratio) / len(ratio), 3) if ratio else None,
+        "deduped_summaries": sum(e["deduped"] for e in entries),
+    }
 
 
 def _answer_sync(question: str, rows: list[dict]) -> str:
     client = _ensure_client()
-    prompt = QA_TMPL.format(
-        question=question.strip(),
-        contexts=_format_contexts(rows)[:12000],
-    )
+    contexts, context_tokens, dups = _format_contexts(rows)
+    prompt = QA_TMPL.format(question=question.strip(), contexts=contexts)
+    started = time.perf_counter()
     response = client.chat.completions.create(
         model=MODEL_NAME,
         messages=[
@@ -77,14 +210,31 @@ def _answer_sync(question: str, rows: list[dict]) -> str:
         ],
         temperature=0.3,
     )
+    usage = getattr(response, "usage", None)
+    _record_stats(
+        {
+            "latency_ms": round((time.perf_counter() - started) * 1000, 1),
+            "prompt_tokens": getattr(usage, "prompt_tokens", None),
+            "completion_tokens": getattr(usage, "completion_tokens", None),
+            "prompt_tokens_est": _estimate_tokens(prompt),
+            "context_tokens_est": context_tokens,
+            "rows": len(rows),
+            "deduped": dups,
+        }
+    )
     return response.choices[0].message.content.strip()
 
 
-async def answer_with_gemini(question: str, rows: list[dict]) -> str:
-    """Solar Pro로 질문 답변 생성 (함수명은 호환성을 위해 유지)"""
+async def answer_with_gemini(question: str, rows: list[dict], fallback: bool = True) -> str:
+    """Solar Pro로 질문 답변 생성 (함수명은 호환성을 위해 유지)
+
+    fallback=False면 실패 시 공지 목록 대신 예외를 그대로 올린다.
+    """
     try:
         return await anyio.to_thread.run_sync(_answer_sync, question, rows)
     except Exception:
+        if not fallback:
+            raise
         bullets = "\n".join([f"- {r['title']} ({r['url']})" for r in rows])
         return f"아래 공지가 도움이 될 수 있어요:\n{bullets}"
 
@@ -102,7 +252,7 @@ def _clean_for_summary(text: str) -> str:
 def _ensure_client():
     if not API_KEY:
         raise RuntimeError("UPSTAGE_API_KEY not set")
-    return OpenAI(api_key=API_KEY, base_url="https://api.upstage.ai/v1/solar")
+    return OpenAI(api_key=API_KEY, base_url=BASE_URL)
 
 
 PROMPT_TMPL = """\